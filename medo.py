@@ -8,22 +8,28 @@ import sys
 import subprocess
 import time
 import string
+import html
 import random
 import re
 import logging
 import argparse
 import signal
 import atexit
-from dataclasses import dataclass, field
-from datetime import datetime
+import threading
+import shutil
+import importlib.util
+import queue
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Optional, Tuple, List, Dict, Any, TYPE_CHECKING
+from typing import Optional, Tuple, List, Dict, Set, Any, Mapping, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from rich.console import Console
 else:
     from rich.console import Console
+from rich.markup import escape
 
 # Made by qvfear | Discord: qvfear
 
@@ -31,10 +37,23 @@ else:
 # GLOBAL STATE FOR CLEANUP
 # ─────────────────────────────────────────────────────────────────────────────
 
-_active_drivers = []
+_active_drivers: Set[Any] = set()
+_drivers_lock = threading.Lock()
 _shutdown_requested = False
 _cleanup_done = False
 _log_lock = __import__('threading').Lock()
+_http_client = None
+_http_lock = threading.Lock()
+_chromedriver_path: Optional[str] = None
+_chromedriver_lock = threading.Lock()
+_account_managers: Set[Any] = set()  # AccountManagers with a running writer thread
+
+# Selenium helpers, bound by import_selenium()
+By: Any = None
+WebDriverWait: Any = None
+EC: Any = None
+TimeoutException: Any = None
+WebDriverException: Any = None
 
 
 def cleanup_all():
@@ -44,13 +63,27 @@ def cleanup_all():
         return
     _cleanup_done = True
     
-    for driver in _active_drivers[:]:  # Copy list to avoid modification during iteration
+    # Snapshot without the lock - this also runs from the signal handler
+    for driver in list(_active_drivers):
         try:
             driver.quit()
         except Exception:
             pass
     _active_drivers.clear()
 
+    # Drain queued accounts before exit - the signal handler leaves via os._exit, skipping atexit
+    for manager in list(_account_managers):
+        try:
+            manager.close(timeout=5)
+        except Exception:
+            pass
+
+    if _http_client is not None:
+        try:
+            _http_client.close()
+        except Exception:
+            pass
+
 
 def signal_handler(signum, frame):
     """Handle interrupt signals gracefully."""
@@ -85,57 +118,90 @@ atexit.register(cleanup_all)
 # CONFIGURATION
 # ─────────────────────────────────────────────────────────────────────────────
 
-
-@dataclass
+# Precompiled patterns - these run against every inbox poll
+_VERIFY_BUTTON_TEXT = "Verify Your Account"
+_VERIFY_LINK_RE = re.compile(r'https://auth\.medo\.dev[^\s<>"\']+')
+# Click tracking wraps every anchor, so pick the one labelled as the verify button
+_VERIFY_ANCHOR_RE = re.compile(
+    r'<a\b[^>]*?\bhref\s*=\s*["\']([^"\']+)["\'][^>]*>(?:(?!</a>).)*?' + re.escape(_VERIFY_BUTTON_TEXT),
+    re.IGNORECASE | re.DOTALL,
+)
+_EMAIL_RE = re.compile(r'[\w.-]+@[\w.-]+\.\w+')
+_LOGIN_SUCCESS_INDICATORS = ("dashboard", "profile", "logout", "credits", "settings", "welcome", "account")
+
+# Selectors - Centralized for easy maintenance (read-only, shared by every SiteConfig)
+_SELECTORS: Mapping[str, Any] = MappingProxyType({
+    # Temp Mail (temp-mail.io)
+    "temp_mail_copy_btn": "copy-button",  # data-qa="copy-button"
+    "temp_mail_email_input": "email",  # id="email"
+    "temp_mail_refresh_btn": "refresh-button",  # data-qa="refresh-button"
+    "temp_mail_email_list": "email-list",  # class="email-list"
+    "temp_mail_message_item": "message",  # class="message" with data-qa="message"
+    "temp_mail_verify_subject": "Verify your email",
+    "temp_mail_verify_btn_text": _VERIFY_BUTTON_TEXT,
+    "temp_mail_body_container": "message__body",
+
+    # Auth
+    "login_link": "//*[contains(text(), 'Login')]",
+    "signup_switch": "link-signup-login",
+    "email_input": "email",
+    "password_input": "password",
+    "terms_checkbox": "agree-terms",
+    "signup_button": "btn-signup",
+    "login_button": "btn-login",
+
+    # Verification
+    "verification_link_pattern": _VERIFY_LINK_RE,
+    "verification_anchor_pattern": _VERIFY_ANCHOR_RE,
+    "verification_email_keywords": ("MeDo", "Verify", "support@medo.dev"),
+})
+
+
+@dataclass(frozen=True)
 class SiteConfig:
     """Site-specific configuration and selectors."""
     site_name: str = "MeDo"
     target_url: str = "https://medo.dev/?invitecode=user-9mj2gtv04um8"
     temp_mail_url: str = "https://temp-mail.io/en/"
+    temp_mail_api_url: str = "https://api.internal.temp-mail.io/api/v3/email/{email}/messages"
     success_message: str = "✨ Account successfully created! Check your credits on your main account."
+    # Origins whose storage is wiped between accounts on a pooled browser
+    storage_origins: Tuple[str, ...] = ("https://medo.dev", "https://auth.medo.dev", "https://temp-mail.io")
 
-    # Selectors - Centralized for easy maintenance
-    selectors: Dict[str, str] = field(default_factory=lambda: {
-        # Temp Mail (temp-mail.io)
-        "temp_mail_copy_btn": "copy-button",  # data-qa="copy-button"
-        "temp_mail_email_input": "email",  # id="email"
-        "temp_mail_refresh_btn": "refresh-button",  # data-qa="refresh-button"
-        "temp_mail_email_list": "email-list",  # class="email-list"
-        "temp_mail_message_item": "message",  # class="message" with data-qa="message"
-        "temp_mail_verify_subject": "Verify your email",
-        "temp_mail_verify_btn_text": "Verify Your Account",
-        "temp_mail_body_container": "message__body",
-
-        # Auth
-        "login_link": "//*[contains(text(), 'Login')]",
-        "signup_switch": "link-signup-login",
-        "email_input": "email",
-        "password_input": "password",
-        "terms_checkbox": "agree-terms",
-        "signup_button": "btn-signup",
-        "login_button": "btn-login",
-
-        # Verification
-        "verification_link_pattern": r'https://auth\.medo\.dev[^\s<>"\']+',
-        "verification_email_keywords": ["MeDo", "Verify", "support@medo.dev"],
-    })
+    # Selectors - shared read-only view, see _SELECTORS
+    selectors: Mapping[str, Any] = field(default_factory=lambda: _SELECTORS)
 
 
-@dataclass
+@dataclass(frozen=True)
 class AutomationConfig:
     """Automation behavior configuration."""
     default_total_accounts: int = 10
     default_workers: int = 3
     max_retries: int = 2
     email_timeout: int = 45  # Reduced from 60
+    email_poll_interval: float = 1.0  # Inbox API poll interval
+    email_poll_max_interval: float = 4.0  # Backoff ceiling for inbox API polls
     page_load_timeout: int = 30  # Reduced from 45
-    implicit_wait: float = 0.2
+    browser_acquire_timeout: int = 300  # Max wait for a pooled browser
+    browser_max_uses: int = 50  # Recycle a pooled browser after this many accounts
+    implicit_wait: float = 0.0  # Explicit WebDriverWaits only
 
     # Browser settings
     window_width: int = 1920
     window_height: int = 1080
     languages: List[str] = field(default_factory=lambda: ["en-US", "en"])
 
+    # Subresources never inspected by the automation (CDP URL patterns)
+    blocked_url_patterns: List[str] = field(default_factory=lambda: [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm", "*.mp3",
+        "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+        "*googlesyndication*", "*facebook.com*", "*facebook.net*",
+    ])
+
+
+# navigator.platform reported by stealth() and every user agent override
+STEALTH_PLATFORM = "Win32"
 
 # User agents for rotation
 USER_AGENTS = [
@@ -157,27 +223,30 @@ class RichLoggingHandler(logging.Handler):
     def __init__(self, console: 'Console'):
         super().__init__()
         self.console = console
-        self.level_colors = {
-            logging.DEBUG: "dim cyan",
-            logging.INFO: "green",
-            logging.WARNING: "yellow",
-            logging.ERROR: "red",
-            logging.CRITICAL: "bold red",
-        }
-        self.level_icons = {
-            logging.DEBUG: "•",
-            logging.INFO: "ℹ",
-            logging.WARNING: "⚠",
-            logging.ERROR: "✗",
-            logging.CRITICAL: "⛔",
+        # (color, icon) per level
+        self.level_styles = {
+            logging.DEBUG: ("dim cyan", "•"),
+            logging.INFO: ("green", "ℹ"),
+            logging.WARNING: ("yellow", "⚠"),
+            logging.ERROR: ("red", "✗"),
+            logging.CRITICAL: ("bold red", "⛔"),
         }
+        # Timestamps only change once per second, so format them once per second
+        self._last_second = -1
+        self._last_timestamp = ""
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        if second != self._last_second:
+            self._last_timestamp = time.strftime("%H:%M:%S", time.localtime(second))
+            self._last_second = second
+        return self._last_timestamp
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
             msg = record.getMessage()
-            color = self.level_colors.get(record.levelno, "white")
-            icon = self.level_icons.get(record.levelno, "•")
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            color, icon = self.level_styles.get(record.levelno, ("white", "•"))
+            timestamp = self._timestamp(record.created)
 
             self.console.print(f"[dim]{timestamp}[/dim] [{color}]{icon}[/] {msg}")
         except Exception:
@@ -233,6 +302,9 @@ class BrowserConfig:
     window_size: Tuple[int, int] = (1920, 1080)
     headless: bool = True
     languages: List[str] = field(default_factory=lambda: ["en-US", "en"])
+    blocked_url_patterns: List[str] = field(default_factory=list)
+    page_load_strategy: str = "eager"
+    implicit_wait: float = 0.0
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -240,12 +312,92 @@ class BrowserConfig:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+def _password_table(chars: str) -> Tuple[bytes, bytes]:
+    """Build a bytes.translate table mapping random bytes onto chars without modulo bias."""
+    limit = 256 - 256 % len(chars)
+    table = bytes(ord(chars[i % len(chars)]) for i in range(256))
+    return table, bytes(range(limit, 256))
+
+
+_PASSWORD_TABLES = {
+    False: _password_table(string.ascii_letters + string.digits),
+    True: _password_table(string.ascii_letters + string.digits + "!@#$%^&*"),
+}
+
+
 def generate_password(length: int = 12, use_special_chars: bool = True) -> str:
     """Generate a secure random password."""
-    chars = string.ascii_letters + string.digits
-    if use_special_chars:
-        chars += "!@#$%^&*"
-    return ''.join(random.SystemRandom().choice(chars) for _ in range(length))
+    table, rejected = _PASSWORD_TABLES[use_special_chars]
+    password = b""
+    while len(password) < length:
+        password += os.urandom(length * 2).translate(table, rejected)
+    return password[:length].decode("ascii")
+
+
+def import_selenium() -> None:
+    """Bind the selenium helpers used by the engine as module globals, once per process.
+
+    Deferred until after setup_dependencies() so a missing selenium can still be installed.
+    """
+    global By, WebDriverWait, EC, TimeoutException, WebDriverException
+    if By is not None:
+        return
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+
+
+def get_http_client() -> Any:
+    """Return the shared HTTP/2 client used by all workers for temp-mail API polling."""
+    global _http_client
+    with _http_lock:
+        if _http_client is None:
+            import httpx
+
+            _http_client = httpx.Client(
+                timeout=5.0,
+                headers={
+                    "User-Agent": random.choice(USER_AGENTS),
+                    "Accept": "application/json",
+                },
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=2,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                ),
+            )
+        return _http_client
+
+
+def override_user_agent(driver: Any, user_agent: str, languages: List[str]) -> None:
+    """Set the current tab's user agent with the same language and platform stealth() uses."""
+    driver.execute_cdp_cmd("Network.setUserAgentOverride", {
+        "userAgent": user_agent,
+        "acceptLanguage": ",".join(languages),
+        "platform": STEALTH_PLATFORM,
+    })
+
+
+def block_requests(driver: Any, patterns: List[str]) -> None:
+    """Block matching subresource requests in the current tab via CDP."""
+    if not patterns:
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+
+def get_chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process (CHROMEDRIVER_PATH overrides)."""
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path is None:
+            _chromedriver_path = os.environ.get("CHROMEDRIVER_PATH")
+            if not _chromedriver_path:
+                from webdriver_manager.chrome import ChromeDriverManager
+
+                _chromedriver_path = ChromeDriverManager().install()
+        return _chromedriver_path
 
 
 def setup_dependencies(silent: bool = True, console: Optional['Console'] = None) -> None:
@@ -253,12 +405,12 @@ def setup_dependencies(silent: bool = True, console: Optional['Console'] = None)
     if console is None:
         console = Console()
 
-    missing_deps = []
-    for dep in ["selenium", "rich", "webdriver-manager", "selenium_stealth"]:
-        try:
-            __import__(dep)
-        except ImportError:
-            missing_deps.append(dep.replace("_", "-"))
+    # Probe with find_spec - locating a module is much cheaper than importing it
+    missing_deps = [
+        dep.replace("_", "-")
+        for dep in ["selenium", "rich", "webdriver_manager", "selenium_stealth", "httpx", "h2"]
+        if importlib.util.find_spec(dep) is None
+    ]
 
     if missing_deps:
         console.print(f"[yellow]⚬ Installing missing dependencies:[/yellow] {', '.join(missing_deps)}...")
@@ -270,12 +422,7 @@ def setup_dependencies(silent: bool = True, console: Optional['Console'] = None)
         console.print("[green]✓ Dependencies installed[/green]")
 
     # Check for Chrome binary
-    chrome_check = subprocess.run(
-        ["which", "google-chrome"],
-        capture_output=True,
-        text=True
-    )
-    if chrome_check.returncode != 0:
+    if shutil.which("google-chrome") is None:
         console.print("[yellow]⚬ Installing Google Chrome...[/yellow]")
         try:
             subprocess.run(
@@ -310,7 +457,6 @@ class BrowserManager:
         from selenium import webdriver
         from selenium.webdriver.chrome.options import Options
         from selenium.webdriver.chrome.service import Service as ChromeService
-        from webdriver_manager.chrome import ChromeDriverManager
         from selenium_stealth import stealth
 
         options = Options()
@@ -325,27 +471,56 @@ class BrowserManager:
         # Enable clipboard access
         options.add_argument("--disable-features=ClipboardPasteWarning")
 
+        # Lean startup - no GPU, extensions, background work or disk cache churn
+        for flag in (
+            "--disable-gpu",
+            "--disable-software-rasterizer",
+            "--disable-extensions",
+            "--disable-background-networking",
+            "--disable-background-timer-throttling",
+            "--disable-renderer-backgrounding",
+            "--disable-translate",
+            "--disable-sync",
+            "--metrics-recording-only",
+            "--mute-audio",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disk-cache-size=1",
+            "--blink-settings=imagesEnabled=false",
+        ):
+            options.add_argument(flag)
+
+        # Skip image rendering and return from get() at DOMContentLoaded
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        options.page_load_strategy = self.config.page_load_strategy
+
         if self.config.headless:
             options.add_argument("--headless=new")
 
         self.driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()),
+            service=ChromeService(get_chromedriver_path()),
             options=options
         )
+        # Missing elements must fail fast; waiting is done with explicit WebDriverWaits
+        self.driver.implicitly_wait(self.config.implicit_wait)
 
         # Apply stealth techniques
         stealth(
             self.driver,
             languages=self.config.languages,
             vendor="Google Inc.",
-            platform="Win32",
+            platform=STEALTH_PLATFORM,
             webgl_vendor="Intel Inc.",
             renderer="Intel Iris OpenGL Engine",
             fix_hairline=True,
         )
 
+        # Block images, fonts and trackers
+        block_requests(self.driver, self.config.blocked_url_patterns)
+
         # Register driver for cleanup
-        _active_drivers.append(self.driver)
+        with _drivers_lock:
+            _active_drivers.add(self.driver)
 
         self.logger.debug(f"Browser created with UA: {self.config.user_agent[:50]}...")
         return self.driver
@@ -358,19 +533,182 @@ class BrowserManager:
             except Exception as e:
                 self.logger.debug(f"Error closing browser: {e}")
             finally:
-                # Remove from active drivers list
-                if self.driver in _active_drivers:
-                    _active_drivers.remove(self.driver)
+                # Remove from active drivers
+                with _drivers_lock:
+                    _active_drivers.discard(self.driver)
                 self.driver = None
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# BROWSER POOL
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class BrowserPool:
+    """Pool of pre-warmed browsers that are reset and reused across accounts."""
+
+    def __init__(
+        self,
+        size: int,
+        auto_config: AutomationConfig,
+        logger: logging.Logger,
+        storage_origins: Tuple[str, ...] = ()
+    ):
+        self.size = max(1, size)
+        self.auto_config = auto_config
+        self.logger = logger
+        self.storage_origins = storage_origins
+        # A None entry is an empty slot; a browser is spawned for it on acquire
+        self._queue: "queue.Queue[Optional[Any]]" = queue.Queue(maxsize=self.size)
+        self._managers: Dict[int, BrowserManager] = {}
+        self._uses: Dict[int, int] = {}
+        self._user_agents: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def _spawn(self) -> Any:
+        """Start a new browser and track it in the pool."""
+        user_agent = random.choice(USER_AGENTS)
+        browser_config = BrowserConfig(
+            user_agent=user_agent,
+            window_size=(self.auto_config.window_width, self.auto_config.window_height),
+            languages=self.auto_config.languages,
+            blocked_url_patterns=self.auto_config.blocked_url_patterns,
+            implicit_wait=self.auto_config.implicit_wait
+        )
+        manager = BrowserManager(browser_config, self.logger)
+        driver = manager.create_driver()
+        with self._lock:
+            self._managers[id(driver)] = manager
+            self._uses[id(driver)] = 0
+            self._user_agents[id(driver)] = user_agent
+        return driver
+
+    def _discard(self, driver: Any) -> None:
+        """Quit a browser and forget about it."""
+        with self._lock:
+            manager = self._managers.pop(id(driver), None)
+            self._uses.pop(id(driver), None)
+            self._user_agents.pop(id(driver), None)
+        if manager:
+            manager.quit()
+
+    @staticmethod
+    def _is_alive(driver: Any) -> bool:
+        """Check that a pooled browser still has a working session."""
+        if driver.session_id is None:
+            return False
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _reset(self, driver: Any) -> None:
+        """Return a browser to a clean state for the next account."""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        # Session storage is per tab and survives navigation, so clear it for the kept tab
+        try:
+            driver.execute_script("window.sessionStorage.clear();")
+        except Exception:
+            pass
+        # Unload the previous page without waiting on get(); the next account's own wait gates the real page
+        driver.execute_cdp_cmd("Page.navigate", {"url": "about:blank"})
+        # Cookies, cache and per-origin storage via CDP instead of per-tab scripts
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        for origin in self.storage_origins:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        # Rotate the user agent between accounts; prepare_tab applies it to tabs opened later
+        user_agent = random.choice(USER_AGENTS)
+        with self._lock:
+            self._user_agents[id(driver)] = user_agent
+        override_user_agent(driver, user_agent, self.auto_config.languages)
+
+    def prepare_tab(self, driver: Any) -> None:
+        """Apply request blocking and the browser's current user agent to a newly opened tab."""
+        block_requests(driver, self.auto_config.blocked_url_patterns)
+        with self._lock:
+            user_agent = self._user_agents.get(id(driver))
+        if user_agent:
+            override_user_agent(driver, user_agent, self.auto_config.languages)
+
+    def warm_up(self) -> None:
+        """Start all browsers in parallel so accounts don't pay startup cost."""
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            futures = [executor.submit(self._spawn) for _ in range(self.size)]
+            for future in as_completed(futures):
+                try:
+                    self._queue.put(future.result())
+                except Exception as e:
+                    self.logger.warning(f"Browser warm-up failed: {e}")
+                    self._queue.put(None)
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """Check out a browser, spawning one if the slot is empty."""
+        try:
+            driver = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            raise Exception(f"No browser available within {timeout}s")
+
+        if driver is not None and not self._is_alive(driver):
+            self.logger.debug("Pooled browser session lost, replacing it")
+            self._discard(driver)
+            driver = None
+
+        if driver is None:
+            try:
+                driver = self._spawn()
+            except Exception:
+                self._queue.put(None)
+                raise
+        return driver
+
+    def release(self, driver: Any) -> None:
+        """Reset a browser and return it to the pool, recycling worn-out ones."""
+        with self._lock:
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+            uses = self._uses[id(driver)]
+
+        if uses >= self.auto_config.browser_max_uses:
+            self.logger.debug(f"Recycling browser after {uses} uses")
+            self._discard(driver)
+            self._queue.put(None)
+            return
+
+        try:
+            self._reset(driver)
+            self._queue.put(driver)
+        except Exception as e:
+            self.logger.debug(f"Browser reset failed, recycling: {e}")
+            self._discard(driver)
+            self._queue.put(None)
+
+    def close(self) -> None:
+        """Quit all pooled browsers."""
+        while True:
+            try:
+                driver = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if driver is not None:
+                self._discard(driver)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # AUTOMATION ENGINE
 # ─────────────────────────────────────────────────────────────────────────────
 
 
 class AutomationEngine:
-    """Main automation engine for account creation workflow."""
+    """Main automation engine for account creation workflow.
+
+    Drivers run with an implicit wait of 0, so find_element(s) returns at once
+    and every wait in here is an explicit WebDriverWait.
+    """
 
     def __init__(
         self,
@@ -379,6 +717,7 @@ class AutomationEngine:
         site_config: SiteConfig,
         auto_config: AutomationConfig,
         logger: logging.Logger,
+        browser_pool: BrowserPool,
         verbose: bool = False,
         console: Optional['Console'] = None
     ):
@@ -389,17 +728,27 @@ class AutomationEngine:
         self.logger = logger
         self.verbose = verbose
         self.console = console
+        import_selenium()
 
-        # Browser configuration
-        browser_config = BrowserConfig(
-            user_agent=random.choice(USER_AGENTS),
-            window_size=(auto_config.window_width, auto_config.window_height),
-            languages=auto_config.languages
-        )
-        self.browser_manager = BrowserManager(browser_config, logger)
+        # Browsers are checked out from the shared pool in run()
+        self.browser_pool = browser_pool
         self.driver = None
         self.wait = None
 
+        # Auth-modal locators, built once instead of per lookup
+        selectors = site_config.selectors
+        self._locators: Dict[str, Tuple[str, str]] = {
+            "login_link": (By.XPATH, selectors["login_link"]),
+            **{name: (By.ID, selectors[name]) for name in (
+                "signup_switch", "email_input", "password_input",
+                "terms_checkbox", "signup_button", "login_button",
+            )},
+        }
+
+        # Temp-mail inbox details, filled in by _create_temp_email
+        self.mailbox: Optional[str] = None
+        self.mail_cookies: Dict[str, str] = {}
+
     def _log(self, message: str, level: str = "info", force: bool = False) -> None:
         """Log a message with thread context and colored output."""
         if self.verbose or force:
@@ -421,25 +770,28 @@ class AutomationEngine:
                     f"{prefix} {message}"
                 )
 
+    def _show_verification_link(self, link: str) -> None:
+        """Print the verification link, always visible regardless of verbosity."""
+        if self.console:
+            # Clean up the link (remove tracking)
+            clean_link = link.split('#')[0]
+            self.console.print(f"    [cyan]📬 Verification link:[/cyan] [dim]{escape(clean_link)}[/dim]")
+
     def _safe_click(self, locator: Tuple[str, str], description: str, timeout: int = 10) -> bool:
-        """Safely click an element with fallback to JavaScript click."""
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.common.exceptions import (
-            TimeoutException, ElementNotInteractableException, ElementClickInterceptedException
-        )
+        """Scroll to and click an element in one script call, with JS and native click fallbacks."""
 
         try:
             self._log(f"Clicking: {description}")
             wait = WebDriverWait(self.driver, timeout)
             element = wait.until(EC.element_to_be_clickable(locator))
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.2)
-            element.click()
+            # Scroll and click in a single round-trip
+            self.driver.execute_script(
+                "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", element
+            )
             self._log(f"✓ {description}", "debug")
             return True
-        except (TimeoutException, ElementNotInteractableException, ElementClickInterceptedException):
+        except TimeoutException:
+            # Present but never clickable - try a JS click anyway
             try:
                 element = self.driver.find_element(*locator)
                 self.driver.execute_script("arguments[0].click();", element)
@@ -448,12 +800,20 @@ class AutomationEngine:
             except Exception as e:
                 self._log(f"✗ Failed to click {description}: {e}", "warning", force=True)
                 return False
+        except WebDriverException:
+            # Scripted click failed - fall back to native mouse events
+            try:
+                element = self.driver.find_element(*locator)
+                self._wait_until_settled(element)
+                element.click()
+                self._log(f"✓ {description} (native click)", "debug")
+                return True
+            except Exception as e:
+                self._log(f"✗ Failed to click {description}: {e}", "warning", force=True)
+                return False
 
     def _wait_for_element(self, locator: Tuple[str, str], timeout: Optional[int] = None) -> Optional[Any]:
         """Wait for element to be present."""
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.common.exceptions import TimeoutException
 
         try:
             wait = WebDriverWait(self.driver, timeout or self.auto_config.page_load_timeout)
@@ -461,21 +821,78 @@ class AutomationEngine:
         except TimeoutException:
             return None
 
+    def _wait_until_settled(self, element: Any, timeout: float = 2) -> None:
+        """Wait until an element stops moving (e.g. after a smooth scroll)."""
+
+        last_location: Dict[str, Any] = {}
+
+        def settled(_) -> bool:
+            location = element.location
+            stable = location == last_location
+            last_location.clear()
+            last_location.update(location)
+            return stable
+
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(settled)
+        except TimeoutException:
+            self._log("Element still moving, clicking anyway", "debug")
+
+    def _wait_for_verification_page(self, timeout: int = 10) -> bool:
+        """Wait until the verification page has loaded; False if it never does."""
+
+        def page_loaded(d) -> bool:
+            # URL and ready state in one round-trip
+            href, state = d.execute_script("return [location.href, document.readyState];")
+            return "email-verification" in href and state == "complete"
+
+        try:
+            WebDriverWait(self.driver, timeout).until(page_loaded)
+            self._log("Verification page loaded", "debug")
+            return True
+        except TimeoutException:
+            self._log("Verification page did not finish loading in time", "debug")
+            return False
+
+    def _open_verification_link(self, link: str) -> None:
+        """Navigate to a verification link, raising if the verification page never loads."""
+        self._log(f"Navigating to verification link: {link[:80]}...", "debug")
+        self.driver.get(link)
+        if not self._wait_for_verification_page():
+            raise Exception(f"Verification page did not load from {link[:80]}")
+
     def _get_verification_link(self, page_source: str) -> Optional[str]:
         """Extract verification link from page source."""
-        pattern = self.site_config.selectors["verification_link_pattern"]
-        match = re.search(pattern, page_source)
+        match = self.site_config.selectors["verification_link_pattern"].search(page_source)
         return match.group(0) if match else None
 
+    def _find_verification_link_in_page(self) -> Optional[str]:
+        """Match the verification link in the browser so only the URL crosses the driver pipe."""
+        link = self.driver.execute_script(
+            "const root = document.querySelector(arguments[1]) || document.body;"
+            "const match = root.innerHTML.match(new RegExp(arguments[0]));"
+            "return match ? match[0] : null;",
+            self.site_config.selectors["verification_link_pattern"].pattern,
+            f".{self.site_config.selectors['temp_mail_body_container']}",
+        )
+        return html.unescape(link) if link else None
+
+    def _find_link_href(self, alternatives: List[List[str]]) -> Optional[str]:
+        """Return the first link href, in document order, containing every substring of any alternative."""
+        return self.driver.execute_script(
+            "const link = [...document.querySelectorAll('a[href]')]"
+            ".find(a => arguments[0].some(group => group.every(part => a.href.includes(part))));"
+            "return link ? link.href : null;",
+            alternatives,
+        )
+
     def _create_temp_email(self) -> Tuple[str, str]:
         """Create temporary email and return (email, username)."""
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
 
-        # Open temp-mail.io in new tab
-        self.driver.execute_script(f"window.open('{self.site_config.temp_mail_url}');")
-        self.driver.switch_to.window(self.driver.window_handles[-1])
+        # Open temp-mail.io in new tab (CDP blocking and UA overrides are per tab, so apply them before loading)
+        self.driver.switch_to.new_window('tab')
+        self.browser_pool.prepare_tab(self.driver)
+        self.driver.get(self.site_config.temp_mail_url)
 
         # Wait for page to load - wait for email input field
         try:
@@ -508,8 +925,12 @@ class AutomationEngine:
                     EC.element_to_be_clickable((By.CSS_SELECTOR, f"[data-qa='{self.site_config.selectors['temp_mail_copy_btn']}']"))
                 )
                 copy_btn.click()
-                time.sleep(0.5)
-                email = self.driver.execute_script("return navigator.clipboard.readText();")
+
+                def clipboard_email(d) -> Optional[str]:
+                    text = d.execute_script("return navigator.clipboard.readText();") or ""
+                    return text if "@" in text else None
+
+                email = WebDriverWait(self.driver, 2, poll_frequency=0.1).until(clipboard_email)
                 if email and "@" in email:
                     self._log(f"Got email from clipboard: {email}", "debug")
             except Exception as e:
@@ -519,7 +940,7 @@ class AutomationEngine:
         if not email:
             try:
                 body_text = self.driver.find_element(By.TAG_NAME, "body").text
-                email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', body_text)
+                email_match = _EMAIL_RE.search(body_text)
                 if email_match:
                     email = email_match.group(0)
                     self._log(f"Got email from page text: {email}", "debug")
@@ -529,8 +950,7 @@ class AutomationEngine:
         if not email or "@" not in email:
             # Debug info
             try:
-                page_title = self.driver.title
-                url = self.driver.current_url
+                url, page_title = self.driver.execute_script("return [location.href, document.title];")
                 input_value = self.driver.find_element(By.ID, self.site_config.selectors["temp_mail_email_input"]).get_attribute("value")
                 body_preview = self.driver.find_element(By.TAG_NAME, "body").text[:500]
                 self._log(f"Debug - URL: {url}", "debug", force=True)
@@ -541,66 +961,197 @@ class AutomationEngine:
                 self._log(f"Debug error: {e}", "debug", force=True)
             raise Exception(f"Could not retrieve email address")
 
+        # Capture mailbox details and session cookies for direct inbox API polling
+        self.mailbox = email.split("@", 1)[0]
+        try:
+            self.mail_cookies = {c["name"]: c["value"] for c in self.driver.get_cookies()}
+        except Exception as e:
+            self._log(f"Could not read temp-mail cookies: {e}", "debug")
+            self.mail_cookies = {}
+
         self._log(f"Created temp email: {email}", "info", force=True)
-        return email, email.split("@")[0]
+        return email, self.mailbox
+
+    def _fill_auth_form(self, email: str, password: str) -> None:
+        """Fill the auth modal credentials and tick the terms checkbox."""
+
+        selectors = self.site_config.selectors
+
+        # Set both values in one call via the native setter so React sees the input events
+        try:
+            filled = self.driver.execute_script(
+                """
+                const [emailId, passwordId, termsId, email, password] = arguments;
+                const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+                const fields = [[document.getElementById(emailId), email], [document.getElementById(passwordId), password]];
+                if (fields.some(([field]) => !field)) return false;
+                for (const [field, value] of fields) {
+                    setValue.call(field, value);
+                    field.dispatchEvent(new Event('input', {bubbles: true}));
+                    field.dispatchEvent(new Event('change', {bubbles: true}));
+                }
+                const terms = document.getElementById(termsId);
+                if (terms && !terms.checked) terms.click();
+                return true;
+                """,
+                selectors["email_input"], selectors["password_input"], selectors["terms_checkbox"],
+                email, password,
+            )
+        except WebDriverException as e:
+            self._log(f"Scripted form fill failed, typing instead: {e}", "debug")
+        else:
+            if not filled:
+                raise Exception("Auth form fields not found")
+            return
+
+        # Fallback: type into the fields (cleared first, the script may have set one already)
+        locators = self._locators
+        for name, value in (("email_input", email), ("password_input", password)):
+            field = self.driver.find_element(*locators[name])
+            field.clear()
+            field.send_keys(value)
+
+        # Check terms checkbox if present
+        boxes = self.driver.find_elements(*locators["terms_checkbox"])
+        if boxes and not boxes[0].is_selected():
+            self.driver.execute_script("arguments[0].click();", boxes[0])
+        else:
+            self._log("Terms checkbox not found or already checked", "debug")
 
     def _register_account(self, email: str, password: str) -> bool:
         """Register account on target site."""
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.expected_conditions import staleness_of
 
         # Navigate to target URL
         self.driver.switch_to.window(self.driver.window_handles[0])
         
-        # Fast page load
+        locators = self._locators
+
+        # Eager page load returns at DOMContentLoaded - wait for the element we need
         self.driver.get(self.site_config.target_url)
-        
-        # Wait for page to fully load
         try:
             WebDriverWait(self.driver, 10).until(
-                lambda d: d.find_element(By.TAG_NAME, "body") is not None
+                EC.presence_of_element_located(locators["login_link"])
             )
-        except:
-            time.sleep(1)
+        except TimeoutException:
+            self._log("Login link not found yet, trying anyway", "debug")
 
         # Click login to open auth modal (fast timeout)
-        self._safe_click((By.XPATH, self.site_config.selectors["login_link"]), "Open login modal", timeout=5)
+        self._safe_click(locators["login_link"], "Open login modal", timeout=5)
 
         # Switch to signup (fast timeout)
-        self._safe_click((By.ID, self.site_config.selectors["signup_switch"]), "Switch to signup", timeout=5)
+        self._safe_click(locators["signup_switch"], "Switch to signup", timeout=5)
 
         # Fill form
-        email_field = self._wait_for_element((By.ID, self.site_config.selectors["email_input"]))
+        email_field = self._wait_for_element(locators["email_input"])
         if not email_field:
             raise Exception("Email field not found")
-        email_field.send_keys(email)
-
-        password_field = self.driver.find_element(By.ID, self.site_config.selectors["password_input"])
-        password_field.send_keys(password)
-
-        # Try to check terms checkbox
-        try:
-            terms_checkbox = self.driver.find_element(By.ID, self.site_config.selectors["terms_checkbox"])
-            if not terms_checkbox.is_selected():
-                self.driver.execute_script("arguments[0].click();", terms_checkbox)
-        except Exception:
-            self._log("Terms checkbox not found or already checked", "debug")
+        self._fill_auth_form(email, password)
 
         # Submit signup (fast timeout)
-        self._safe_click((By.ID, self.site_config.selectors["signup_button"]), "Submit registration", timeout=5)
-        return True
-
-    def _verify_email(self, email: str) -> bool:
-        """Wait for and click verification email."""
-        from selenium.webdriver.common.by import By
+        signup_locator = locators["signup_button"]
+        signup_buttons = self.driver.find_elements(*signup_locator)
+        old_url = self.driver.current_url
+        self._safe_click(signup_locator, "Submit registration", timeout=5)
 
-        self.driver.switch_to.window(self.driver.window_handles[-1])
+        # Wait for the form to be submitted (redirect or modal closing)
+        if signup_buttons:
+            try:
+                WebDriverWait(self.driver, 5).until(EC.any_of(
+                    EC.url_changes(old_url),
+                    EC.staleness_of(signup_buttons[0]),
+                    EC.invisibility_of_element(signup_buttons[0]),
+                ))
+            except TimeoutException:
+                self._log("No post-signup change detected", "debug")
+        return True
 
-        keywords = self.site_config.selectors["verification_email_keywords"]
+    def _fetch_inbox(self, email: str) -> List[Dict[str, Any]]:
+        """Fetch inbox messages for the temp mailbox from the temp-mail JSON API."""
+        url = self.site_config.temp_mail_api_url.format(email=email)
+        # Cookies go in the header since the client is shared across accounts
+        cookie_header = "; ".join(f"{name}={value}" for name, value in self.mail_cookies.items())
+        response = get_http_client().get(url, headers={"Cookie": cookie_header} if cookie_header else None)
+        response.raise_for_status()
+        messages = response.json()
+        return messages if isinstance(messages, list) else []
+
+    def _verify_email(self, email: str) -> Optional[str]:
+        """Poll the temp-mail inbox API and return the verification link.
+
+        Falls back to the browser inbox if the API stays unreachable or the email
+        has no recognisable link; the email is then opened in the temp-mail tab
+        and None is returned.
+        """
+        keywords = [kw.lower() for kw in self.site_config.selectors["verification_email_keywords"]]
+        anchor_pattern = self.site_config.selectors["verification_anchor_pattern"]
         start_time = time.time()
+        interval = self.auto_config.email_poll_interval
+        api_failures = 0
 
         self._log("Waiting for verification email...", "info")
 
+        while time.time() - start_time < self.auto_config.email_timeout:
+            # Check for shutdown request
+            if _shutdown_requested:
+                raise Exception("Shutdown requested")
+
+            try:
+                messages = self._fetch_inbox(email)
+                api_failures = 0
+                interval = self.auto_config.email_poll_interval
+            except Exception as e:
+                api_failures += 1
+                self._log(f"Inbox API error ({api_failures}): {e}", "debug")
+                if api_failures >= 3:
+                    self._log("Inbox API unavailable, falling back to browser inbox", "warning", force=True)
+                    self._verify_email_in_browser(email, start_time)
+                    return None
+                # Back off exponentially while the API is failing
+                messages = []
+                interval = min(interval * 2, self.auto_config.email_poll_max_interval)
+
+            for message in messages:
+                header = f"{message.get('subject', '')} {message.get('from', '')}".lower()
+                if not any(kw in header for kw in keywords):
+                    continue
+
+                body = message.get("body_html") or message.get("body_text") or ""
+                match = anchor_pattern.search(body)
+                verification_link = match.group(1) if match else self._get_verification_link(body)
+                if not verification_link:
+                    # Let the browser fallbacks click the button instead of guessing a link
+                    self._log("No verification link in email body, opening it in the browser", "debug")
+                    self._verify_email_in_browser(email, start_time)
+                    return None
+
+                verification_link = html.unescape(verification_link)
+                self._log("✓ Verification email received!", "success", force=True)
+                self._show_verification_link(verification_link)
+                return verification_link
+
+            self._log(f"Checking for email... ({int(time.time() - start_time)}s)", "debug")
+            time.sleep(interval)
+
+        raise Exception(f"Verification email not received within {self.auto_config.email_timeout}s")
+
+    def _verify_email_in_browser(self, email: str, start_time: float) -> bool:
+        """Wait for and click verification email in the temp-mail tab."""
+
+        driver = self.driver
+        driver.switch_to.window(driver.window_handles[-1])
+
+        keywords = [kw.lower() for kw in self.site_config.selectors["verification_email_keywords"]]
+        email_list_selector = f".{self.site_config.selectors['temp_mail_email_list']}"
+        email_list_locator = (By.CSS_SELECTOR, email_list_selector)
+        body_locator = (By.CSS_SELECTOR, f".{self.site_config.selectors['temp_mail_body_container']}")
+
+        def email_list_text(d) -> str:
+            # One round-trip instead of find_element + .text
+            return d.execute_script(
+                "const el = document.querySelector(arguments[0]); return el ? el.innerText : '';",
+                email_list_selector,
+            ) or ""
+
         # Faster refresh intervals
         while time.time() - start_time < self.auto_config.email_timeout:
             # Check for shutdown request
@@ -609,54 +1160,64 @@ class AutomationEngine:
 
             try:
                 # Click refresh button to check for new emails
+                prev_text = page_text = email_list_text(driver)
+
+                def inbox_changed(d) -> bool:
+                    nonlocal page_text
+                    page_text = email_list_text(d)
+                    return page_text != prev_text
+
                 try:
-                    refresh_btn = self.driver.find_element(By.CSS_SELECTOR, f"[data-qa='{self.site_config.selectors['temp_mail_refresh_btn']}']")
+                    refresh_btn = driver.find_element(By.CSS_SELECTOR, f"[data-qa='{self.site_config.selectors['temp_mail_refresh_btn']}']")
                     refresh_btn.click()
-                    time.sleep(1.5)  # Wait for page to load after refresh
+                    # Wait for the inbox to change after refresh
+                    try:
+                        WebDriverWait(driver, 3, poll_frequency=0.2).until(inbox_changed)
+                    except TimeoutException:
+                        pass
                 except Exception:
-                    self.driver.refresh()
-                    time.sleep(1.5)
+                    driver.refresh()
+                    try:
+                        WebDriverWait(driver, 5).until(EC.presence_of_element_located(email_list_locator))
+                    except TimeoutException:
+                        pass
+                    page_text = email_list_text(driver)
                 
-                # Check for email list with messages
+                # Check for email list with messages (text already fetched by the wait)
                 try:
-                    email_list = self.driver.find_element(By.CSS_SELECTOR, f".{self.site_config.selectors['temp_mail_email_list']}")
-                    page_text = email_list.text.lower()
+                    page_text = page_text.lower()
 
-                    if any(kw.lower() in page_text for kw in keywords):
+                    if any(kw in page_text for kw in keywords):
                         self._log("✓ Verification email received!", "success", force=True)
                         
                         # Try to extract and show the verification link
                         verification_link = None
                         try:
-                            page_source = self.driver.page_source
-                            verification_link = self._get_verification_link(page_source)
+                            verification_link = self._find_verification_link_in_page()
                             if verification_link:
-                                # Clean up the link (remove tracking)
-                                clean_link = verification_link.split('#')[0]
-                                # Print directly to ensure visibility
-                                with _log_lock:
-                                    print(f"\033[96m    📬 Verification link:\033[0m \033[2m{clean_link}\033[0m", flush=True)
+                                self._show_verification_link(verification_link)
                         except Exception as e:
-                            print(f"\033[91m    Error extracting link: {e}\033[0m", flush=True)
+                            if self.console:
+                                self.console.print(f"    [red]Error extracting link: {escape(str(e))}[/red]")
                         
                         # Find and click on the email message
                         try:
                             # Look for message with "Verify your email" subject
-                            message = self.driver.find_element(
+                            message = driver.find_element(
                                 By.XPATH, f"//*[contains(@title, 'Verify your email') or contains(@data-qa, 'message')]"
                             )
                             message.click()
-                            time.sleep(1.5)
+                            self._wait_for_element(body_locator, timeout=5)
                             self._log("Email opened", "debug")
                             return True
                         except Exception:
                             # Fallback: click on first message in list
                             try:
-                                message_item = self.driver.find_element(
+                                message_item = driver.find_element(
                                     By.CSS_SELECTOR, f".{self.site_config.selectors['temp_mail_message_item']}"
                                 )
                                 message_item.click()
-                                time.sleep(1.5)
+                                self._wait_for_element(body_locator, timeout=5)
                                 self._log("Email opened (fallback)", "debug")
                                 return True
                             except Exception:
@@ -668,19 +1229,20 @@ class AutomationEngine:
             except Exception as e:
                 self._log(f"Checking for email... ({int(time.time() - start_time)}s)", "debug")
 
-            time.sleep(2)  # Reduced check interval
+            time.sleep(self.auto_config.email_poll_interval)
 
         raise Exception(f"Verification email not received within {self.auto_config.email_timeout}s")
 
-    def _complete_verification(self) -> bool:
+    def _complete_verification(self, verification_link: Optional[str] = None) -> bool:
         """Navigate to verification link and complete process."""
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
+
+        # Link already extracted from the inbox API - skip the DOM fallbacks
+        if verification_link:
+            self._open_verification_link(verification_link)
+            return True
         
         # Scroll down to see the full email content
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(1)
         
         verification_link = None
         
@@ -690,56 +1252,51 @@ class AutomationEngine:
                 EC.element_to_be_clickable((By.XPATH, f"//*[contains(text(), '{self.site_config.selectors['temp_mail_verify_btn_text']}')]"))
             )
             self.driver.execute_script("arguments[0].scrollIntoView(true);", verify_btn)
-            time.sleep(0.3)
+            self._wait_until_settled(verify_btn)
             verify_btn.click()
             self._log("Clicked Verify button", "debug")
-            time.sleep(3)
-            
+
             # Check if we were redirected
-            if "auth.medo.dev" in self.driver.current_url or "email-verification" in self.driver.current_url:
-                self._log("Verification completed via button click", "debug")
-                time.sleep(2)
-                return True
+            def redirected(d) -> bool:
+                url = d.current_url
+                return "auth.medo.dev" in url or "email-verification" in url
+
+            try:
+                WebDriverWait(self.driver, 5).until(redirected)
+                if self._wait_for_verification_page():
+                    self._log("Verification completed via button click", "debug")
+                    return True
+            except TimeoutException:
+                self._log("No redirect after button click", "debug")
         except Exception as e:
             self._log(f"Button click failed: {e}", "debug")
         
-        # Method 2: Extract and navigate to verification link from page source
+        # Method 2: Extract and navigate to verification link from the email body
         try:
-            page_source = self.driver.page_source
-            verification_link = self._get_verification_link(page_source)
+            verification_link = self._find_verification_link_in_page()
             if verification_link:
-                self._log(f"Navigating to verification link: {verification_link[:80]}...", "debug")
-                self.driver.get(verification_link)
-                # Wait for verification page to fully load
-                time.sleep(5)
-                self._log("Verification page loaded, waiting...", "debug")
+                self._open_verification_link(verification_link)
                 return True
         except Exception as e:
-            self._log(f"Method 2 (page source link) failed: {e}", "debug")
+            self._log(f"Method 2 (email body link) failed: {e}", "debug")
         
         # Method 3: Look for any href containing auth.medo.dev
         try:
-            links = self.driver.find_elements(By.TAG_NAME, "a")
-            for link in links:
-                href = link.get_attribute("href")
-                if href and "auth.medo.dev" in href and "email-verification" in href:
-                    self._log(f"Found verification link in DOM: {href[:80]}...", "debug")
-                    self.driver.get(href)
-                    time.sleep(5)
-                    return True
+            href = self._find_link_href([["auth.medo.dev", "email-verification"]])
+            if href:
+                self._log("Found verification link in DOM", "debug")
+                self._open_verification_link(href)
+                return True
         except Exception as e:
             self._log(f"Method 3 (DOM links) failed: {e}", "debug")
         
         # Method 4: Look for SendGrid redirect links
         try:
-            links = self.driver.find_elements(By.TAG_NAME, "a")
-            for link in links:
-                href = link.get_attribute("href")
-                if href and ("u55282886.ct.sendgrid.net" in href or "click?upn=" in href):
-                    self._log(f"Found SendGrid redirect link, navigating...", "debug")
-                    self.driver.get(href)
-                    time.sleep(5)
-                    return True
+            href = self._find_link_href([["u55282886.ct.sendgrid.net"], ["click?upn="]])
+            if href:
+                self._log("Found SendGrid redirect link", "debug")
+                self._open_verification_link(href)
+                return True
         except Exception as e:
             self._log(f"Method 4 (SendGrid links) failed: {e}", "debug")
         
@@ -747,74 +1304,73 @@ class AutomationEngine:
 
     def _login_and_validate(self, email: str, password: str) -> bool:
         """Login to validate account creation."""
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
         
-        # Go back to medo.dev
+        locators = self._locators
+
+        # Go back to medo.dev and wait for the login link
         self.driver.get("https://medo.dev")
-        time.sleep(2)
-        
-        # Wait for page to load
         try:
             WebDriverWait(self.driver, 8).until(
-                lambda d: d.find_element(By.TAG_NAME, "body") is not None
+                EC.presence_of_element_located(locators["login_link"])
             )
-        except:
-            time.sleep(1)
+        except TimeoutException:
+            self._log("Login link not found yet, trying anyway", "debug")
         
         # Click login to open auth modal
-        self._safe_click((By.XPATH, self.site_config.selectors["login_link"]), "Open login", timeout=5)
-        time.sleep(1)
+        self._safe_click(locators["login_link"], "Open login", timeout=5)
         
-        # Fill credentials
-        email_field = self._wait_for_element((By.ID, self.site_config.selectors["email_input"]))
-        if not email_field:
-            raise Exception("Login email field not found")
-        email_field.send_keys(email)
-
-        password_field = self.driver.find_element(By.ID, self.site_config.selectors["password_input"])
-        password_field.send_keys(password)
-        
-        # Try to check terms checkbox if exists
+        # Fill credentials once the modal is visible
         try:
-            terms_checkbox = self.driver.find_element(By.ID, self.site_config.selectors["terms_checkbox"])
-            if not terms_checkbox.is_selected():
-                self.driver.execute_script("arguments[0].click();", terms_checkbox)
-        except Exception:
-            self._log("Terms checkbox not found or already checked", "debug")
+            WebDriverWait(self.driver, self.auto_config.page_load_timeout).until(
+                EC.visibility_of_element_located(locators["email_input"])
+            )
+        except TimeoutException:
+            raise Exception("Login email field not found")
+        self._fill_auth_form(email, password)
 
         # Submit login
-        self._safe_click((By.ID, self.site_config.selectors["login_button"]), "Login", timeout=5)
+        login_url = self.driver.current_url
+        self._safe_click(locators["login_button"], "Login", timeout=5)
         
         # Wait for redirect/dashboard
-        time.sleep(3)
-        
-        # Check if login succeeded by looking for dashboard elements or URL change
-        current_url = self.driver.current_url
-        page_source = self.driver.page_source.lower()
-        
-        # Success indicators
-        success_indicators = [
-            "dashboard", "profile", "logout", "credits", "settings",
-            "welcome", "account"
-        ]
-        
-        if any(indicator in page_source for indicator in success_indicators):
-            self._log("Login successful - dashboard detected", "info", force=True)
-            return True
+        try:
+            WebDriverWait(self.driver, 10).until(EC.any_of(
+                EC.url_contains("dashboard"),
+                EC.url_changes(login_url),
+                EC.presence_of_element_located((By.PARTIAL_LINK_TEXT, "Logout")),
+                EC.invisibility_of_element_located(locators["login_button"]),
+            ))
+        except TimeoutException:
+            self._log("No post-login change detected", "debug")
         
-        if "login" not in current_url.lower() and "auth" not in current_url.lower():
+        # Cheapest check first - one current_url read settles the common redirect case
+        current_url = self.driver.current_url.lower()
+        if "login" not in current_url and "auth" not in current_url:
             self._log("Login successful - URL changed", "info", force=True)
             return True
 
-        # If still on login page, check for error messages
+        # URL inconclusive - look for dashboard elements, then success indicators in the page text
         try:
-            error_msgs = self.driver.find_elements(By.CLASS_NAME, "error")
-            if error_msgs:
-                self._log(f"Login error detected: {error_msgs[0].text}", "warning")
-        except:
-            pass
+            WebDriverWait(self.driver, 2).until(EC.any_of(
+                EC.url_contains("dashboard"),
+                EC.presence_of_element_located((By.PARTIAL_LINK_TEXT, "Logout")),
+                EC.presence_of_element_located((By.CSS_SELECTOR, "[href*='dashboard']")),
+            ))
+            self._log("Login successful - dashboard detected", "info", force=True)
+            return True
+        except TimeoutException:
+            if self.driver.execute_script(
+                "const t = (document.body ? document.body.innerText : '').toLowerCase();"
+                "return arguments[0].some(w => t.includes(w));",
+                list(_LOGIN_SUCCESS_INDICATORS),
+            ):
+                self._log("Login successful - dashboard detected", "info", force=True)
+                return True
+
+        # If still on login page, check for error messages
+        error_msgs = self.driver.find_elements(By.CLASS_NAME, "error")
+        if error_msgs:
+            self._log(f"Login error detected: {error_msgs[0].text}", "warning")
         
         # Assume success if we got this far without errors
         self._log("Login completed", "info", force=True)
@@ -829,9 +1385,8 @@ class AutomationEngine:
         self._log(f"Starting account {account_idx}/{total}", "info", force=True)
 
         try:
-            # Initialize browser
-            self.driver = self.browser_manager.create_driver()
-            from selenium.webdriver.support.ui import WebDriverWait
+            # Check out a pre-warmed browser
+            self.driver = self.browser_pool.acquire(timeout=self.auto_config.browser_acquire_timeout)
             self.wait = WebDriverWait(self.driver, self.auto_config.page_load_timeout)
 
             # Step 1: Create temp email
@@ -842,10 +1397,10 @@ class AutomationEngine:
             self._log("Registration submitted", "debug")
 
             # Step 3: Verify email
-            self._verify_email(email)
+            verification_link = self._verify_email(email)
 
             # Step 4: Complete verification
-            self._complete_verification()
+            self._complete_verification(verification_link)
 
             # Step 5: Login and validate
             self._login_and_validate(email, password)
@@ -876,22 +1431,10 @@ class AutomationEngine:
             )
 
         finally:
-            # Always close the browser completely
-            try:
-                if self.driver:
-                    # Clear all data first
-                    self.driver.delete_all_cookies()
-                    self.driver.execute_script("window.localStorage.clear();")
-                    self.driver.execute_script("window.sessionStorage.clear();")
-                    # Then quit
-                    self.driver.quit()
-                    # Remove from active drivers
-                    if self.driver in _active_drivers:
-                        _active_drivers.remove(self.driver)
-            except Exception:
-                pass
-            finally:
-                self.driver = None
+            # Always reset the browser and hand it back to the pool
+            if self.driver:
+                self.browser_pool.release(self.driver)
+            self.driver = None
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -905,6 +1448,10 @@ class AccountManager:
     def __init__(self, accounts_file: str = "accounts.txt", logger: Optional[logging.Logger] = None):
         self.accounts_file = Path(accounts_file)
         self.logger = logger or logging.getLogger(__name__)
+        self._fh = None  # Long-lived append handle, owned by the writer thread
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
         self._ensure_file_exists()
 
     def _ensure_file_exists(self) -> None:
@@ -914,21 +1461,68 @@ class AccountManager:
             self.logger.debug(f"Created accounts file: {self.accounts_file}")
 
     def save_account(self, email: str, password: str) -> bool:
-        """Save account credentials to file."""
+        """Queue account credentials for the background writer."""
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop, name="account-writer", daemon=True)
+                self._writer.start()
+                _account_managers.add(self)
+                atexit.register(self.close)
+        self._queue.put((email, password))
+        return True
+
+    def _writer_loop(self) -> None:
+        """Write queued accounts in batches until the stop sentinel arrives."""
+        while True:
+            # Block for the first item, then take whatever else is already waiting
+            batch = [self._queue.get()]
+            while batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            accounts = [item for item in batch if item is not None]
+            if accounts:
+                self._write_batch(accounts)
+            if batch[-1] is None:
+                return
+
+    def _write_batch(self, accounts: List[Tuple[str, str]]) -> None:
+        """Append a batch of accounts to the file in one write."""
         try:
-            with open(self.accounts_file, "a") as f:
-                f.write(f"{email}:{password}\n")
-            self.logger.debug(f"Saved account: {email}")
-            return True
+            if self._fh is None:
+                self._fh = open(self.accounts_file, "ab", buffering=64 * 1024)
+            buf = bytearray()
+            for email, password in accounts:
+                buf += b"%s:%s\n" % (email.encode(), password.encode())
+            self._fh.write(buf)
+            # Flush every batch so written accounts survive a crash
+            self._fh.flush()
+            for email, _ in accounts:
+                self.logger.debug(f"Saved account: {email}")
         except Exception as e:
-            self.logger.error(f"Failed to save account: {e}")
-            return False
+            self.logger.error(f"Failed to save {len(accounts)} account(s): {e}")
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop the writer, flushing pending accounts, and close the file handle."""
+        # No lock here: this also runs from the signal handler, which may interrupt save_account
+        writer, self._writer = self._writer, None
+        _account_managers.discard(self)
+        if writer is not None:
+            self._queue.put(None)
+            writer.join(timeout)
+            if writer.is_alive():
+                return  # Still writing; leave the handle to it
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
 
     def get_existing_count(self) -> int:
         """Get count of existing accounts in file."""
         try:
-            with open(self.accounts_file, "r") as f:
-                return sum(1 for line in f if line.strip() and ":" in line)
+            # Binary lines: no decoding, and any line holding ":" is non-blank
+            with open(self.accounts_file, "rb") as f:
+                return sum(b":" in line for line in f)
         except Exception:
             return 0
 
@@ -997,6 +1591,7 @@ class AutomationOrchestrator:
         # Initialize managers
         self.account_manager = AccountManager(logger=self.logger)
         self.link_manager = LinkManager()
+        self.browser_pool: Optional[BrowserPool] = None
 
     def _get_invite_link(self) -> str:
         """Get invite link from args or prompt."""
@@ -1038,6 +1633,7 @@ class AutomationOrchestrator:
             site_config=self.site_config,
             auto_config=self.auto_config,
             logger=self.logger,
+            browser_pool=self.browser_pool,
             verbose=self.args.verbose or account_idx <= 1,
             console=self.console
         )
@@ -1075,7 +1671,7 @@ class AutomationOrchestrator:
 
         # Get configuration
         invite_link = self._get_invite_link()
-        self.site_config.target_url = invite_link
+        self.site_config = replace(self.site_config, target_url=invite_link)
 
         # Ask for total accounts
         if not self.args.total:
@@ -1113,6 +1709,14 @@ class AutomationOrchestrator:
         self.console.print(f"   └─ [white]Target:[/white] [dim]{invite_link[:50]}...[/dim]")
         self.console.print()
 
+        # Pre-warm one browser per worker
+        self.browser_pool = BrowserPool(
+            min(workers, total), self.auto_config, self.logger,
+            storage_origins=self.site_config.storage_origins
+        )
+        with self.console.status(f"[cyan]Starting {self.browser_pool.size} browser(s)...[/cyan]"):
+            self.browser_pool.warm_up()
+
         # Progress display
         results: List[AccountResult] = []
         completed = 0
@@ -1125,7 +1729,7 @@ class AutomationOrchestrator:
             TextColumn("•"),
             TimeElapsedColumn(),
             console=self.console,
-            refresh_per_second=10,
+            auto_refresh=False,  # Redraw only when an account changes state
         )
 
         try:
@@ -1142,8 +1746,9 @@ class AutomationOrchestrator:
                         task,
                         advance=1,
                         description=f"[green]✓ Created[/green] ({result.email})",
+                        refresh=True,
                     )
-                    # Save successful accounts immediately
+                    # Hand successful accounts to the background writer
                     if result.email and result.password:
                         self.account_manager.save_account(result.email, result.password)
                 else:
@@ -1151,6 +1756,7 @@ class AutomationOrchestrator:
                         task,
                         advance=1,
                         description=f"[red]✗ Failed[/red]: {result.error[:30]}",
+                        refresh=True,
                     )
 
             if workers == 1:
@@ -1158,7 +1764,7 @@ class AutomationOrchestrator:
                 for i in range(1, total + 1):
                     if _shutdown_requested:
                         break
-                    progress.update(task, description=f"[yellow]⏳ Processing[/yellow] account {i}/{total}")
+                    progress.update(task, description=f"[yellow]⏳ Processing[/yellow] account {i}/{total}", refresh=True)
                     result = self._run_with_retry(i, total)
                     update_progress(result)
             else:
@@ -1184,6 +1790,8 @@ class AutomationOrchestrator:
             pass
         finally:
             progress.stop()
+            self.browser_pool.close()
+            self.account_manager.close()
         
         # Check if shutdown was requested
         if _shutdown_requested:
@@ -1349,14 +1957,15 @@ def main() -> int:
 
     # Setup dependencies
     setup_dependencies(silent=not args.verbose, console=console)
+    import_selenium()
 
-    # Initialize configuration
+    # Initialize configuration (shared by every engine)
     site_config = SiteConfig()
     auto_config = AutomationConfig()
 
     # Override accounts file if specified
     if args.accounts_file != "accounts.txt":
-        site_config.success_message = f"Accounts saved to: {args.accounts_file}"
+        site_config = replace(site_config, success_message=f"Accounts saved to: {args.accounts_file}")
 
     # Run automation
     orchestrator = AutomationOrchestrator(site_config, auto_config, args)